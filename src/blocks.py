@@ -1,4 +1,5 @@
 from enum import Enum
+import re
 
 
 class BlockType(Enum):
@@ -6,23 +7,32 @@ class BlockType(Enum):
     HEADING = "heading"
     CODE = "code"
     QUOTE = "quote"
-    UNORDERED_LIST = "quote"
+    UNORDERED_LIST = "unordered_list"
     ORDERED_LIST = "ordered_list"
 
 
+# Blocks with at least this many newlines are classified by searching for
+# the first line that breaks a pattern instead of checking line by line.
+# The searches run in C and stop at the first failing line.
+BULK_LINE_THRESHOLD = 256
+
+NOT_QUOTE_LINE_PATTERN = re.compile(r"^(?!>)", re.MULTILINE)
+NOT_UNORDERED_LINE_PATTERN = re.compile(r"^(?!- )", re.MULTILINE)
+
+# "1. ", "2. ", ... grown on demand, so ordered list checks don't format a
+# prefix for every line of every block
+ORDERED_PREFIXES = []
+
+
 def block_to_block_type(block):
-    lines = block.split("\n")
-    first_line = block.split(" ")[0]
+    block_type = heading_or_code_type(block)
+    if block_type is not None:
+        return block_type
 
-    # Headers
-    if first_line.startswith("#"):
-        if all(char == "#" for char in first_line):
-            if 1 <= len(first_line) <= 6:
-                return BlockType.HEADING
+    if block.count("\n") >= BULK_LINE_THRESHOLD:
+        return bulk_line_block_type(block)
 
-    # Code
-    if block.startswith("```") and block.endswith("```"):
-        return BlockType.CODE
+    lines = block.split("\n")
 
     # Quote
     if all(line.startswith(">") for line in lines):
@@ -46,3 +56,42 @@ def block_to_block_type(block):
 
     # Paragraph (if nothing else matches)
     return BlockType.PARAGRAPH
+
+
+def heading_or_code_type(block):
+    first_line = block.partition(" ")[0]
+
+    # Headers
+    if first_line.startswith("#"):
+        if all(char == "#" for char in first_line):
+            if 1 <= len(first_line) <= 6:
+                return BlockType.HEADING
+
+    # Code
+    if block.startswith("```") and block.endswith("```"):
+        return BlockType.CODE
+
+    return None
+
+
+def bulk_line_block_type(block):
+    """Classify a large block by its line prefixes.
+
+    Gives the same result as the per-line checks in block_to_block_type,
+    so headings and code blocks must be ruled out before calling this.
+    """
+    if NOT_QUOTE_LINE_PATTERN.search(block) is None:
+        return BlockType.QUOTE
+
+    if NOT_UNORDERED_LINE_PATTERN.search(block) is None:
+        return BlockType.UNORDERED_LIST
+
+    # The ordered list check ignores the last line, same as the per-line path
+    lines = block.split("\n")
+    numbered = len(lines) - 1
+    while len(ORDERED_PREFIXES) < numbered:
+        ORDERED_PREFIXES.append(f"{len(ORDERED_PREFIXES) + 1}. ")
+    if numbered > 0 and all(map(str.startswith, lines[:-1], ORDERED_PREFIXES)):
+        return BlockType.ORDERED_LIST
+
+    return BlockType.PARAGRAPH
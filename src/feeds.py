@@ -0,0 +1,91 @@
+from htmlnode import LeafNode, ParentNode
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+import html
+import math
+import os
+
+
+def page_url(base_url, entry):
+    return base_url.rstrip("/") + "/" + entry["path"].lstrip("/")
+
+
+def write_sitemap(manifest, base_url, file):
+    """Stream a sitemap.xml for every page in the manifest to file."""
+    file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    file.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+    for entry in manifest.entries.values():
+        lastmod = datetime.fromtimestamp(entry["mtime"], timezone.utc)
+        file.write(
+            f"<url><loc>{escape(page_url(base_url, entry))}</loc>"
+            f"<lastmod>{lastmod.date().isoformat()}</lastmod></url>\n"
+        )
+    file.write("</urlset>\n")
+
+
+def write_rss(manifest, base_url, file, title, description="", limit=20):
+    """Stream an RSS 2.0 feed of the most recently modified pages to file."""
+    file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    file.write('<rss version="2.0"><channel>\n')
+    file.write(f"<title>{escape(title)}</title>\n")
+    file.write(f"<link>{escape(base_url)}</link>\n")
+    file.write(f"<description>{escape(description)}</description>\n")
+    for _, entry in manifest.newest(limit):
+        url = escape(page_url(base_url, entry))
+        published = datetime.fromtimestamp(entry["mtime"], timezone.utc)
+        file.write(
+            f"<item><title>{escape(entry['title'])}</title>"
+            f"<link>{url}</link><guid>{url}</guid>"
+            f"<pubDate>{format_datetime(published)}</pubDate>"
+            f"<description>{escape(entry['summary'])}</description></item>\n"
+        )
+    file.write("</channel></rss>\n")
+
+
+def page_list_name(number):
+    if number == 1:
+        return "index.html"
+    return f"index-{number}.html"
+
+
+def page_list_to_html_node(entries, number, page_count, base_path="/"):
+    items = []
+    for entry in entries:
+        href = html.escape(page_url(base_path, entry))
+        link = LeafNode("a", html.escape(entry["title"]), {"href": href})
+        summary = LeafNode("p", html.escape(entry["summary"]))
+        items.append(ParentNode("li", [link, summary]))
+
+    children = [ParentNode("ul", items)] if items else []
+    navigation = []
+    if number > 1:
+        previous = page_list_name(number - 1)
+        navigation.append(LeafNode("a", "Newer", {"href": previous}))
+    if number < page_count:
+        following = page_list_name(number + 1)
+        navigation.append(LeafNode("a", "Older", {"href": following}))
+    if navigation:
+        children.append(ParentNode("nav", navigation))
+    return ParentNode("div", children)
+
+
+def write_page_lists(manifest, directory, per_page=50, base_path="/"):
+    """Write paginated lists of all pages, newest first.
+
+    Page links are prefixed with base_path for subdirectory deployments.
+    Returns the names of the files written.
+    """
+    entries = [entry for _, entry in manifest.newest(len(manifest.entries))]
+    page_count = max(math.ceil(len(entries) / per_page), 1)
+    names = []
+    for number in range(1, page_count + 1):
+        start = (number - 1) * per_page
+        node = page_list_to_html_node(
+            entries[start : start + per_page], number, page_count, base_path
+        )
+        name = page_list_name(number)
+        with open(os.path.join(directory, name), "w") as file:
+            file.write(node.to_html())
+        names.append(name)
+    return names
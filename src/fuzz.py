@@ -0,0 +1,186 @@
+from contextlib import contextmanager
+from helpers import (
+    extract_markdown_links,
+    markdown_to_blocks,
+    markdown_to_html_node,
+    text_to_textnode,
+)
+import blocks
+import random
+import sys
+
+
+WORDS = ["alpha", "beta", "gamma", "x", "1", "hello world", " ", "  ", "."]
+INLINE_MARKUP = ["**", "_", "`", "[", "]", "(", ")", "!", "#", ">", "- ", "1. "]
+LANGUAGES = ["", "python", "js", "bash", "json", "nope"]
+
+
+def random_inline(rng: random.Random, pieces=8, stray=0.2):
+    """Generate inline markdown, mostly well formed but with stray markup."""
+    parts = []
+    for _ in range(rng.randint(0, pieces)):
+        choice = rng.random()
+        word = rng.choice(WORDS)
+        if choice < stray:
+            parts.append(rng.choice(INLINE_MARKUP))
+        elif choice < 0.5:
+            parts.append(word)
+        elif choice < 0.7:
+            delimiter = rng.choice(["**", "_", "`"])
+            parts.append(f"{delimiter}{word}{delimiter}")
+        elif choice < 0.85:
+            parts.append(f"[{word}]({rng.choice(WORDS)})")
+        else:
+            parts.append(f"![{word}]({rng.choice(WORDS)})")
+    return "".join(parts)
+
+
+def random_block(rng: random.Random, stray=0.01):
+    def inline():
+        return random_inline(rng, stray=stray)
+
+    kind = rng.randrange(7)
+    line_count = rng.choice([1, 2, 3, 5, 20])
+    if kind == 0:
+        return "#" * rng.randint(1, 7) + " " + inline()
+    if kind == 1:
+        language = rng.choice(LANGUAGES)
+        code = "\n".join(inline() for _ in range(line_count))
+        return f"```{language}\n{code}\n```"
+    if kind == 2:
+        prefixes = [">", "> ", ">>"]
+        return "\n".join(rng.choice(prefixes) + inline() for _ in range(line_count))
+    if kind == 3:
+        return "\n".join("- " + inline() for _ in range(line_count))
+    if kind == 4:
+        numbers = list(range(1, line_count + 1))
+        if rng.random() < 0.3:
+            numbers[rng.randrange(line_count)] += 1
+        return "\n".join(f"{number}. {inline()}" for number in numbers)
+    if kind == 5:
+        # Mixed line prefixes, the awkward cases for line classification
+        prefixes = ["", ">", "- ", "-", "1. ", "2. ", "#"]
+        return "\n".join(rng.choice(prefixes) + inline() for _ in range(line_count))
+    return "\n".join(inline() for _ in range(line_count))
+
+
+def random_markdown(rng: random.Random, max_blocks=6, stray=0.01):
+    # Stray markup on any line raises for the whole page, so keep it rare
+    separators = ["\n\n", "\n\n\n", "\n\n  "]
+    markdown = ""
+    for _ in range(rng.randint(1, max_blocks)):
+        markdown += random_block(rng, stray) + rng.choice(separators)
+    return markdown
+
+
+def run_engine(engine, value):
+    """Return the engine's result, or the type and message of its error."""
+    try:
+        return ("ok", engine(value))
+    except Exception as error:
+        return ("error", type(error).__name__, str(error))
+
+
+def shrink(value: str, still_fails):
+    """Greedily remove lines, then characters, while still_fails holds."""
+    changed = True
+    while changed:
+        changed = False
+        lines = value.split("\n")
+        for index in range(len(lines) - 1, -1, -1):
+            candidate = "\n".join(lines[:index] + lines[index + 1 :])
+            if still_fails(candidate):
+                lines = candidate.split("\n")
+                value = candidate
+                changed = True
+
+        chunk = max(len(value) // 2, 1)
+        while chunk >= 1:
+            start = 0
+            while start < len(value):
+                candidate = value[:start] + value[start + chunk :]
+                if still_fails(candidate):
+                    value = candidate
+                    changed = True
+                else:
+                    start += chunk
+            chunk //= 2
+    return value
+
+
+def find_mismatch(reference, candidate, generate, iterations=500, seed=0):
+    """Run both engines on generated inputs and shrink the first mismatch.
+
+    Returns None when every outcome matched, otherwise a tuple of the
+    shrunk input and both engines' outcomes for it.
+    """
+    rng = random.Random(seed)
+
+    def mismatches(value):
+        return run_engine(reference, value) != run_engine(candidate, value)
+
+    for _ in range(iterations):
+        value = generate(rng)
+        if mismatches(value):
+            value = shrink(value, mismatches)
+            return value, run_engine(reference, value), run_engine(candidate, value)
+    return None
+
+
+@contextmanager
+def bulk_line_threshold(threshold):
+    previous = blocks.BULK_LINE_THRESHOLD
+    blocks.BULK_LINE_THRESHOLD = threshold
+    try:
+        yield
+    finally:
+        blocks.BULK_LINE_THRESHOLD = previous
+
+
+def render_markdown(markdown):
+    block_types = [
+        blocks.block_to_block_type(block) for block in markdown_to_blocks(markdown)
+    ]
+    return block_types, markdown_to_html_node(markdown).to_html()
+
+
+def reference_markdown(markdown):
+    with bulk_line_threshold(sys.maxsize):
+        return render_markdown(markdown)
+
+
+def bulk_markdown(markdown):
+    with bulk_line_threshold(0):
+        return render_markdown(markdown)
+
+
+def reference_inline(text):
+    return text_to_textnode(text), extract_markdown_links(text)
+
+
+# Alternative engines to check against the reference implementations. Add
+# new inline or block engines here before switching the converter to them.
+DIFFERENTIAL_CHECKS = [
+    ("bulk line checks", reference_markdown, bulk_markdown, random_markdown),
+]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    failed = False
+    for name, reference, candidate, generate in DIFFERENTIAL_CHECKS:
+        mismatch = find_mismatch(reference, candidate, generate, iterations)
+        if mismatch is None:
+            print(f"{name}: {iterations} inputs matched")
+            continue
+        failed = True
+        value, expected, actual = mismatch
+        print(f"{name}: mismatch on {value!r}")
+        print(f"  reference: {expected}")
+        print(f"  candidate: {actual}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,53 +1,61 @@
 from textnode import TextNode, TextType
 from htmlnode import HTMLNode, ParentNode, text_node_to_html_node
 from blocks import BlockType, block_to_block_type
+from highlight import highlight_to_html_nodes
 from typing import List
 import re
 
 
-def markdown_to_html_node(markdown):
+def markdown_to_html_node(markdown, page=None):
     blocks = markdown_to_blocks(markdown)
     children = []
     for block in blocks:
-        html_node = block_to_html_node(block)
+        html_node = block_to_html_node(block, page)
         children.append(html_node)
     return ParentNode("div", children, None)
 
 
-def block_to_html_node(block):
+def block_to_html_node(block, page=None):
     block_type = block_to_block_type(block)
     if block_type == BlockType.PARAGRAPH:
-        return paragraph_to_html_node(block)
+        return paragraph_to_html_node(block, page)
     if block_type == BlockType.HEADING:
-        return heading_to_html_node(block)
+        return heading_to_html_node(block, page)
     if block_type == BlockType.CODE:
         return code_to_html_node(block)
     if block_type == BlockType.ORDERED_LIST:
-        return olist_to_html_node(block)
+        return olist_to_html_node(block, page)
     if block_type == BlockType.UNORDERED_LIST:
-        return ulist_to_html_node(block)
+        return ulist_to_html_node(block, page)
     if block_type == BlockType.QUOTE:
-        return quote_to_html_node(block)
+        return quote_to_html_node(block, page)
     raise ValueError("invalid block type")
 
 
-def text_to_children(text):
+def text_to_children(text, page=None):
     text_nodes = text_to_textnode(text)
+    resolve_url = None
+    if page is not None:
+        page.add_text_nodes(text_nodes)
+        if page.routes is not None:
+            resolve_url = page.resolve_url
     children = []
     for text_node in text_nodes:
-        html_node = text_node_to_html_node(text_node)
+        html_node = text_node_to_html_node(text_node, resolve_url)
         children.append(html_node)
     return children
 
 
-def paragraph_to_html_node(block):
+def paragraph_to_html_node(block, page=None):
     lines = block.split("\n")
     paragraph = " ".join(lines)
-    children = text_to_children(paragraph)
+    children = text_to_children(paragraph, page)
+    if page is not None and page.summary is None:
+        page.summary = "".join(child.value for child in children)
     return ParentNode("p", children)
 
 
-def heading_to_html_node(block):
+def heading_to_html_node(block, page=None):
     level = 0
     for char in block:
         if char == "#":
@@ -57,41 +65,58 @@ def heading_to_html_node(block):
     if level + 1 >= len(block):
         raise ValueError(f"invalid heading level: {level}")
     text = block[level + 1 :]
-    children = text_to_children(text)
-    return ParentNode(f"h{level}", children)
+    children = text_to_children(text, page)
+    if page is None:
+        return ParentNode(f"h{level}", children)
+    title = "".join(child.value for child in children)
+    slug = page.add_heading(level, title)
+    return ParentNode(f"h{level}", children, {"id": slug})
+
+
+CODE_LANGUAGE_PATTERN = re.compile(r"```([\w+#.-]+)\n")
 
 
 def code_to_html_node(block):
     if not block.startswith("```") or not block.endswith("```"):
         raise ValueError("invalid code block")
-    text = block[4:-3]
-    raw_text_node = TextNode(text, TextType.TEXT)
-    child = text_node_to_html_node(raw_text_node)
-    code = ParentNode("code", [child])
+    language_match = CODE_LANGUAGE_PATTERN.match(block)
+    if language_match is None:
+        text = block[4:-3]
+        raw_text_node = TextNode(text, TextType.TEXT)
+        child = text_node_to_html_node(raw_text_node)
+        code = ParentNode("code", [child])
+        return ParentNode("pre", [code])
+
+    language = language_match.group(1)
+    text = block[language_match.end() : -3]
+    children = highlight_to_html_nodes(text, language)
+    if children is None:
+        children = [text_node_to_html_node(TextNode(text, TextType.TEXT))]
+    code = ParentNode("code", children, {"class": f"language-{language}"})
     return ParentNode("pre", [code])
 
 
-def olist_to_html_node(block):
+def olist_to_html_node(block, page=None):
     items = block.split("\n")
     html_items = []
     for item in items:
         text = item[3:]
-        children = text_to_children(text)
+        children = text_to_children(text, page)
         html_items.append(ParentNode("li", children))
     return ParentNode("ol", html_items)
 
 
-def ulist_to_html_node(block):
+def ulist_to_html_node(block, page=None):
     items = block.split("\n")
     html_items = []
     for item in items:
         text = item[2:]
-        children = text_to_children(text)
+        children = text_to_children(text, page)
         html_items.append(ParentNode("li", children))
     return ParentNode("ul", html_items)
 
 
-def quote_to_html_node(block):
+def quote_to_html_node(block, page=None):
     lines = block.split("\n")
     new_lines = []
     for line in lines:
@@ -99,7 +124,7 @@ def quote_to_html_node(block):
             raise ValueError("invalid quote block")
         new_lines.append(line.lstrip(">").strip())
     content = " ".join(new_lines)
-    children = text_to_children(content)
+    children = text_to_children(content, page)
     return ParentNode("blockquote", children)
 
 
@@ -0,0 +1,194 @@
+from htmlnode import LeafNode
+from typing import Callable, Dict, List, Tuple
+import hashlib
+import re
+
+
+# A highlighter turns source code into (css class, text) tokens, where the
+# class is None for text that isn't highlighted. Class names follow the
+# short names Pygments uses (k, s, c, m, ...) so one stylesheet fits both.
+Highlighter = Callable[[str], List[Tuple[str | None, str]]]
+
+HIGHLIGHTERS: Dict[str, Highlighter] = {}
+
+LANGUAGE_ALIASES = {
+    "py": "python",
+    "js": "javascript",
+    "sh": "bash",
+    "shell": "bash",
+}
+
+MAX_CACHE_SIZE = 4096
+TOKEN_CACHE: Dict[Tuple[str, str], Tuple[Tuple[str | None, str], ...]] = {}
+
+# Pygments lexer lookups by language, None when Pygments has no lexer for it.
+# The lookup takes milliseconds, far longer than highlighting a snippet.
+PYGMENTS_HIGHLIGHTERS: Dict[str, Highlighter | None] = {}
+
+
+def register_highlighter(language: str, highlighter: Highlighter):
+    HIGHLIGHTERS[language] = highlighter
+
+
+def highlight_to_html_nodes(code: str, language: str):
+    """Return highlighted LeafNodes for code, or None if the language is unknown.
+
+    Tokens are cached by (language, code hash), so a snippet repeated on
+    many pages is only highlighted once per process.
+    """
+    language = LANGUAGE_ALIASES.get(language, language)
+    key = (language, hashlib.sha1(code.encode()).hexdigest())
+    tokens = TOKEN_CACHE.get(key)
+    if tokens is None:
+        highlighter = HIGHLIGHTERS.get(language)
+        if highlighter is None:
+            if language not in PYGMENTS_HIGHLIGHTERS:
+                PYGMENTS_HIGHLIGHTERS[language] = pygments_highlighter(language)
+            highlighter = PYGMENTS_HIGHLIGHTERS[language]
+        if highlighter is None:
+            return None
+        tokens = tuple(highlighter(code))
+        if len(TOKEN_CACHE) >= MAX_CACHE_SIZE:
+            TOKEN_CACHE.clear()
+        TOKEN_CACHE[key] = tokens
+
+    html_nodes = []
+    for css_class, text in tokens:
+        if css_class is None:
+            html_nodes.append(LeafNode(tag=None, value=text))
+        else:
+            html_nodes.append(LeafNode("span", text, {"class": css_class}))
+    return html_nodes
+
+
+def regex_highlighter(rules: List[Tuple[str, str]]) -> Highlighter:
+    """Build a single pass lexer from (css class, pattern) rules.
+
+    The rules are combined into one alternation, so earlier rules win when
+    several could match at the same position.
+    """
+    classes = [css_class for css_class, _ in rules]
+    pattern = re.compile("|".join(f"({rule})" for _, rule in rules))
+
+    def highlighter(code):
+        tokens = []
+        position = 0
+        for match in pattern.finditer(code):
+            start = match.start()
+            if start == match.end():
+                continue
+            if start > position:
+                tokens.append((None, code[position:start]))
+            tokens.append((classes[match.lastindex - 1], match.group()))  # pyright: ignore
+            position = match.end()
+        if position < len(code):
+            tokens.append((None, code[position:]))
+        return tokens
+
+    return highlighter
+
+
+def keywords(words):
+    return r"\b(?:" + "|".join(words.split()) + r")\b"
+
+
+NUMBER_RULE = r"\b\d+(?:\.\d+)?\b"
+
+register_highlighter(
+    "python",
+    regex_highlighter(
+        [
+            ("c", r"#[^\n]*"),
+            ("s", r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\''),
+            ("s", r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''),
+            (
+                "k",
+                keywords(
+                    "False None True and as assert async await break class "
+                    "continue def del elif else except finally for from "
+                    "global if import in is lambda match case nonlocal not or "
+                    "pass raise return try while with yield"
+                ),
+            ),
+            ("m", NUMBER_RULE),
+        ]
+    ),
+)
+
+register_highlighter(
+    "javascript",
+    regex_highlighter(
+        [
+            ("c", r"//[^\n]*|/\*[\s\S]*?\*/"),
+            ("s", r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`'),
+            (
+                "k",
+                keywords(
+                    "async await break case catch class const continue "
+                    "default delete do else export extends false finally for "
+                    "function if import in instanceof let new null of return "
+                    "switch this throw true try typeof undefined var while "
+                    "yield"
+                ),
+            ),
+            ("m", NUMBER_RULE),
+        ]
+    ),
+)
+
+register_highlighter(
+    "bash",
+    regex_highlighter(
+        [
+            ("c", r"(?<![\w$])#[^\n]*"),
+            ("s", r'"(?:\\.|[^"\\])*"|\'[^\']*\''),
+            ("nv", r"\$\{[^}\n]*\}|\$\w+"),
+            (
+                "k",
+                keywords(
+                    "if then else elif fi for while until do done case esac "
+                    "function in return export local"
+                ),
+            ),
+        ]
+    ),
+)
+
+register_highlighter(
+    "json",
+    regex_highlighter(
+        [
+            ("nt", r'"(?:\\.|[^"\\\n])*"(?=\s*:)'),
+            ("s", r'"(?:\\.|[^"\\\n])*"'),
+            ("k", keywords("true false null")),
+            ("m", r"-?\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b"),
+        ]
+    ),
+)
+
+
+def pygments_highlighter(language: str) -> Highlighter | None:
+    """Fall back to a Pygments lexer when Pygments is installed."""
+    try:
+        from pygments import lex
+        from pygments.lexers import get_lexer_by_name
+        from pygments.token import STANDARD_TYPES
+        from pygments.util import ClassNotFound
+    except ImportError:
+        return None
+
+    try:
+        # Pygments strips leading and trailing newlines and adds a final one
+        # by default. The built-in highlighters keep the code as it is.
+        lexer = get_lexer_by_name(language, stripnl=False, ensurenl=False)
+    except ClassNotFound:
+        return None
+
+    def highlighter(code):
+        tokens = []
+        for token_type, text in lex(code, lexer):
+            css_class = STANDARD_TYPES.get(token_type) or None
+            tokens.append((css_class, text))
+        return tokens
+
+    return highlighter
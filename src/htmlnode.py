@@ -60,7 +60,7 @@ class ParentNode(HTMLNode):
         return f"<{self.tag}{self.props_to_html()}>{child_html}</{self.tag}>"
 
 
-def text_node_to_html_node(text_node: TextNode):
+def text_node_to_html_node(text_node: TextNode, resolve_url=None):
     match text_node.text_type:
         case TextType.TEXT:
             return LeafNode(tag=None, value=text_node.text)
@@ -75,11 +75,13 @@ def text_node_to_html_node(text_node: TextNode):
             return LeafNode(tag="code", value=text_node.text)
 
         case TextType.LINK:
-            props = {"href": text_node.url}
+            url = resolve_url(text_node.url) if resolve_url else text_node.url
+            props = {"href": url}
             return LeafNode(
                 tag="a", value=text_node.text, props=props  # pyright: ignore
             )
 
         case TextType.IMAGE:
-            props = {"src": text_node.url, "alt": text_node.text}
+            url = resolve_url(text_node.url) if resolve_url else text_node.url
+            props = {"src": url, "alt": text_node.text}
             return LeafNode(tag="img", value="", props=props)
@@ -0,0 +1,53 @@
+from typing import Dict
+import heapq
+import json
+import os
+
+
+class Manifest:
+    """Per-page build metadata, keyed by page id and kept between builds.
+
+    Each entry holds the title, first paragraph, source mtime and output
+    path of a page. Sitemaps, feeds and page lists are generated from these
+    entries alone, so they never need the markdown to be parsed again.
+    """
+
+    def __init__(self, entries: Dict[str, Dict] | None = None):
+        self.entries = entries if entries is not None else {}
+        self.changed = False
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            return cls()
+        with open(path) as file:
+            return cls(json.load(file))
+
+    def save(self, path):
+        with open(path, "w") as file:
+            json.dump(self.entries, file, separators=(",", ":"), ensure_ascii=False)
+        self.changed = False
+
+    def is_stale(self, page_id, mtime):
+        entry = self.entries.get(page_id)
+        return entry is None or entry["mtime"] != mtime
+
+    def update(self, page, mtime, output_path):
+        entry = {
+            "title": page.title,
+            "summary": page.summary or "",
+            "mtime": mtime,
+            "path": output_path,
+        }
+        if self.entries.get(page.page_id) != entry:
+            self.entries[page.page_id] = entry
+            self.changed = True
+
+    def remove(self, page_id):
+        if self.entries.pop(page_id, None) is not None:
+            self.changed = True
+
+    def newest(self, count):
+        return heapq.nlargest(
+            count, self.entries.items(), key=lambda item: item[1]["mtime"]
+        )
@@ -0,0 +1,100 @@
+from textnode import TextType
+from routes import content_path, is_external_url, split_url
+import re
+
+
+SLUG_STRIP_PATTERN = re.compile(r"[^\w\s-]")
+SLUG_SPACE_PATTERN = re.compile(r"[\s-]+")
+
+
+class Page:
+    """Collects per-page data while its markdown is converted to HTML.
+
+    Pass a Page to markdown_to_html_node and the block builders fill it in
+    during the same pass, so nothing has to walk the finished tree again.
+    Headings get an id attribute when converted with a Page, and the
+    resulting table of contents is kept in toc as plain dicts so templates
+    can use it directly.
+
+    With a RouteTable, link and image URLs are rewritten to their output
+    routes, resolved relative to page_id as the page's content-relative
+    source path. URLs that match no route are kept and listed in
+    unresolved.
+    """
+
+    def __init__(self, page_id: str, routes=None):
+        self.page_id = page_id
+        self.routes = routes
+        self.unresolved = []
+        self.text_spans = []
+        self.links = []
+        self.toc = []
+        self.anchors = set()
+        self.summary = None
+
+    def add_text_nodes(self, text_nodes):
+        # Comprehensions keep this cheap, it runs for every inline span
+        self.text_spans += [
+            node.text for node in text_nodes if node.text_type is TextType.TEXT
+        ]
+        self.links += [
+            node.url for node in text_nodes if node.text_type is TextType.LINK
+        ]
+
+    def add_heading(self, level, title):
+        base_slug = slugify(title) or "section"
+        slug = base_slug
+        suffix = 1
+        while slug in self.anchors:
+            slug = f"{base_slug}-{suffix}"
+            suffix += 1
+        self.anchors.add(slug)
+        self.toc.append({"level": level, "title": title, "id": slug})
+        return slug
+
+    def resolve_url(self, url):
+        if self.routes is None:
+            return url
+        resolved = self.routes.resolve(url, self.page_id)
+        if resolved is None:
+            self.unresolved.append(url)
+            return url
+        return resolved
+
+    @property
+    def title(self):
+        if self.toc:
+            return self.toc[0]["title"]
+        return self.page_id
+
+    def __repr__(self):
+        return f"Page({self.page_id})"
+
+
+def slugify(text):
+    slug = SLUG_STRIP_PATTERN.sub("", text.lower()).strip()
+    return SLUG_SPACE_PATTERN.sub("-", slug)
+
+
+def broken_anchor_links(pages):
+    """Return (page id, url) for links whose #fragment matches no heading.
+
+    pages maps page ids, the content-relative source paths, to Page
+    objects. A link is checked when it is a bare "#fragment" or when its
+    path resolves, the same way RouteTable.resolve does, to a known page.
+    """
+    broken = []
+    for page_id, page in pages.items():
+        for url in page.links:
+            if is_external_url(url):
+                continue
+            path, suffix = split_url(url)
+            _, _, fragment = suffix.partition("#")
+            if not fragment:
+                continue
+            target = pages.get(content_path(path, page_id)) if path else page
+            if target is None:
+                continue
+            if fragment not in target.anchors:
+                broken.append((page_id, url))
+    return broken
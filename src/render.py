@@ -0,0 +1,84 @@
+from helpers import markdown_to_html_node
+from page import Page
+import gc
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+class RenderStats:
+    """Counters collected while rendering a batch of pages.
+
+    Peak RSS is the high-water mark of the whole process, not just of this
+    render. It is read before and after rendering, and if the render never
+    went above the earlier peak both values are the same.
+    """
+
+    def __init__(self):
+        self.pages = 0
+        self.gc_collections = 0
+        self.gc_pause_seconds = 0.0
+        self.peak_rss_kb_before = None
+        self.peak_rss_kb = None
+        self._gc_started = None
+
+    def on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_started = time.perf_counter()
+        elif self._gc_started is not None:
+            self.gc_pause_seconds += time.perf_counter() - self._gc_started
+            self.gc_collections += 1
+            self._gc_started = None
+
+    def __repr__(self):
+        return (
+            f"RenderStats({self.pages} pages, {self.gc_collections} collections, "
+            f"{self.gc_pause_seconds * 1000:.1f}ms gc, "
+            f"{self.peak_rss_kb_before}KB -> {self.peak_rss_kb}KB peak rss)"
+        )
+
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return usage // 1024
+    return usage
+
+
+def render_pages(sources, write, batch_size=100, stats=None):
+    """Render (page id, markdown) pairs and pass each Page and its HTML to write.
+
+    The node trees built for a page hold no reference cycles, so reference
+    counting frees them as soon as to_html is done. Cyclic GC only adds
+    pauses here, so it is turned off while rendering. The youngest
+    generation is collected after every batch_size pages to catch cycles
+    made by write, and a full collection runs once at the end.
+    """
+    if stats is None:
+        stats = RenderStats()
+    stats.peak_rss_kb_before = peak_rss_kb()
+    gc_was_enabled = gc.isenabled()
+    gc.callbacks.append(stats.on_gc)
+    gc.disable()
+    try:
+        for page_id, markdown in sources:
+            page = Page(page_id)
+            html = markdown_to_html_node(markdown, page).to_html()
+            write(page, html)
+            stats.pages += 1
+            if stats.pages % batch_size == 0:
+                gc.collect(0)
+        gc.collect()
+    finally:
+        gc.callbacks.remove(stats.on_gc)
+        if gc_was_enabled:
+            gc.enable()
+        stats.peak_rss_kb = peak_rss_kb()
+    return stats
@@ -0,0 +1,115 @@
+from typing import Dict
+import hashlib
+import os
+import posixpath
+import re
+import timeit
+
+
+URL_SCHEME_PATTERN = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*:")
+
+
+class RouteTable:
+    """Maps content-relative source paths to the URLs they are served at.
+
+    Built once from the content tree, so resolving a link is a dict lookup
+    with no filesystem access. Markdown files map to .html routes, other
+    files are assets and can be mapped to fingerprinted names.
+    """
+
+    def __init__(self, routes: Dict[str, str] | None = None, base_path="/"):
+        self.base_path = base_path.rstrip("/") + "/"
+        self.routes = {}
+        for source, output in (routes or {}).items():
+            self.add(source, output)
+
+    def add(self, source, output):
+        self.routes[source] = self.base_path + output.lstrip("/")
+
+    @classmethod
+    def from_directory(cls, directory, base_path="/", fingerprint_assets=False):
+        table = cls(base_path=base_path)
+        for root, _, files in os.walk(directory):
+            for name in files:
+                path = os.path.join(root, name)
+                source = os.path.relpath(path, directory).replace(os.sep, "/")
+                table.add(source, output_path(path, source, fingerprint_assets))
+        return table
+
+    def resolve(self, url, source=""):
+        """Return the routed URL for a link found in the page at source.
+
+        External URLs and bare #fragments are returned unchanged. Returns
+        None when the target is not in the content tree.
+        """
+        if is_external_url(url) or url.startswith("#"):
+            return url
+
+        path, suffix = split_url(url)
+        key = content_path(path, source)
+        route = self.routes.get(key)
+        if route is None:
+            return None
+        return route + suffix
+
+
+def is_external_url(url):
+    return not url or url.startswith("//") or URL_SCHEME_PATTERN.match(url) is not None
+
+
+def split_url(url):
+    """Split a URL into its path and the ?query / #fragment suffix."""
+    split_at = len(url)
+    for separator in "?#":
+        index = url.find(separator)
+        if index != -1 and index < split_at:
+            split_at = index
+    return url[:split_at], url[split_at:]
+
+
+def content_path(path, source):
+    """Return the content-relative path a link from source points to."""
+    directory = posixpath.dirname(source)
+    if path.startswith("/"):
+        return path[1:]
+    if path.startswith(".") or "/." in path or "//" in path:
+        return posixpath.normpath(posixpath.join(directory, path))
+    if directory:
+        # Plain relative paths are common and don't need normalising
+        return directory + "/" + path
+    return path
+
+
+def output_path(path, source, fingerprint):
+    stem, extension = posixpath.splitext(source)
+    if extension == ".md":
+        return stem + ".html"
+    if not fingerprint:
+        return source
+    with open(path, "rb") as file:
+        digest = hashlib.sha256(file.read()).hexdigest()[:8]
+    return f"{stem}.{digest}{extension}"
+
+
+def benchmark(count=100_000):
+    """Print the average cost of resolving a few typical links."""
+    table = RouteTable(base_path="/docs")
+    for number in range(10_000):
+        table.add(f"blog/post-{number}.md", f"blog/post-{number}.html")
+        table.add(f"images/pic-{number}.png", f"images/pic-{number}.1a2b3c4d.png")
+    urls = [
+        "post-42.md",
+        "../images/pic-7.png",
+        "/blog/post-9.md#intro",
+        "https://example.com/",
+        "missing.md",
+    ]
+    for url in urls:
+        seconds = timeit.timeit(
+            lambda: table.resolve(url, "blog/index.md"), number=count
+        )
+        print(f"{url}: {seconds / count * 1e9:.0f}ns per link")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,268 @@
+from array import array
+from collections import defaultdict
+from functools import partial
+from itertools import accumulate
+from typing import Dict
+import json
+import multiprocessing
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# A posting is one integer, the page number shifted above the position
+POSITION_BITS = 20
+MAX_POSITIONS = 1 << POSITION_BITS
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SearchIndex:
+    """Inverted index from terms to the pages and positions they occur at.
+
+    A posting is page_number << POSITION_BITS | position. Pages are added
+    in order and positions only grow within a page, so each term's postings
+    are sorted. They are kept delta-encoded as they are added, each one as
+    its difference from the term's previous posting, so writing the index
+    is only file I/O.
+    """
+
+    def __init__(self):
+        self.page_ids = []
+        self.deltas: Dict[str, array] = defaultdict(partial(array, "Q"))
+        self.last_postings: Dict[str, int] = {}
+
+    def add_page(self, page):
+        self.add_text(page.page_id, " ".join(page.text_spans))
+
+    def add_text(self, page_id, text):
+        page_number = len(self.page_ids)
+        self.page_ids.append(page_id)
+
+        first = page_number << POSITION_BITS
+        terms = tokenize(text)[:MAX_POSITIONS]
+        for position, term in enumerate(terms):
+            posting = first + position
+            self.deltas[term].append(posting - self.last_postings.get(term, 0))
+            self.last_postings[term] = posting
+
+    def search(self, term):
+        deltas = self.deltas.get(term.lower())
+        if deltas is None:
+            return []
+        postings = accumulate(deltas)
+        page_numbers = dict.fromkeys(posting >> POSITION_BITS for posting in postings)
+        return [self.page_ids[page_number] for page_number in page_numbers]
+
+    def shards(self, prefix_length=1):
+        shards = {}
+        for term in sorted(self.deltas):
+            prefix = term[:prefix_length]
+            shards.setdefault(prefix, {})[term] = self.deltas[term]
+        return shards
+
+    def write(self, directory, prefix_length=1):
+        """Write pages.json and one shard per term prefix under shards/.
+
+        Shard files are named after the hex of the prefix's UTF-8 bytes, so
+        any term is a safe file name and prefixes that only differ by case
+        can't collide. Clients compute the same name to find a term's shard.
+        """
+        shard_directory = os.path.join(directory, "shards")
+        os.makedirs(shard_directory, exist_ok=True)
+        write_compact_json(os.path.join(directory, "pages.json"), self.page_ids)
+        for prefix, shard in self.shards(prefix_length).items():
+            write_shard(os.path.join(shard_directory, shard_name(prefix)), shard)
+
+
+class BackgroundSearchIndex:
+    """Builds a SearchIndex in a separate process, off the render path.
+
+    add_page only joins a page's text spans and queues them. Every
+    batch_size pages the batch is sent to the indexing process, which
+    tokenizes it and builds the postings while the next pages render.
+    write waits for that process to write the index and raises any error
+    it hit along the way.
+    """
+
+    def __init__(self, batch_size=100):
+        self.batch_size = batch_size
+        self.batch = []
+        self.connection, worker_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=index_worker, args=(worker_connection,), daemon=True
+        )
+        self.process.start()
+        worker_connection.close()
+
+    def add_page(self, page):
+        self.batch.append((page.page_id, " ".join(page.text_spans)))
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.batch:
+            self.connection.send(("pages", self.batch))
+            self.batch = []
+
+    def write(self, directory, prefix_length=1):
+        self.flush()
+        self.connection.send(("write", directory, prefix_length))
+        error = self.connection.recv()
+        self.connection.close()
+        self.process.join()
+        if error is not None:
+            raise error
+
+
+def index_worker(connection):
+    """Index the pages sent by a BackgroundSearchIndex until asked to write.
+
+    An error stops the indexing but not the reading, so the sender never
+    blocks on a full pipe. It is sent back in reply to the write message.
+    """
+    index = SearchIndex()
+    error = None
+    while True:
+        kind, *arguments = connection.recv()
+        if error is None:
+            try:
+                if kind == "pages":
+                    for page_id, text in arguments[0]:
+                        index.add_text(page_id, text)
+                else:
+                    index.write(*arguments)
+            except Exception as exception:
+                error = exception
+        if kind == "write":
+            connection.send(error)
+            connection.close()
+            return
+
+
+def shard_name(prefix):
+    return prefix.encode().hex() + ".bin"
+
+
+def decode_postings(encoded):
+    mask = MAX_POSITIONS - 1
+    return [
+        (posting >> POSITION_BITS, posting & mask) for posting in accumulate(encoded)
+    ]
+
+
+def write_shard(path, shard):
+    """Write a shard of encoded postings as one binary file.
+
+    The file starts with the length of a JSON header as a little-endian
+    uint32. The header maps each term to the offset and count of its
+    postings in the little-endian uint64 deltas that follow it.
+    """
+    header = {}
+    offset = 0
+    for term, deltas in shard.items():
+        header[term] = [offset, len(deltas)]
+        offset += len(deltas)
+    header_bytes = json.dumps(header, separators=(",", ":"), ensure_ascii=False)
+    header_bytes = header_bytes.encode()
+
+    with open(path, "wb") as file:
+        file.write(len(header_bytes).to_bytes(4, "little"))
+        file.write(header_bytes)
+        for deltas in shard.values():
+            if sys.byteorder == "big":
+                deltas = array("Q", deltas)
+                deltas.byteswap()
+            deltas.tofile(file)
+
+
+def read_shard(path):
+    with open(path, "rb") as file:
+        header_length = int.from_bytes(file.read(4), "little")
+        header = json.loads(file.read(header_length))
+        deltas = array("Q")
+        deltas.frombytes(file.read())
+    if sys.byteorder == "big":
+        deltas.byteswap()
+    return {
+        term: deltas[offset : offset + count]
+        for term, (offset, count) in header.items()
+    }
+
+
+def write_compact_json(path, data):
+    with open(path, "w") as file:
+        json.dump(data, file, separators=(",", ":"), ensure_ascii=False)
+
+
+def benchmark(page_count=10_000, repeats=3):
+    """Print how much indexing adds to converting and writing page_count pages."""
+    from helpers import markdown_to_html_node
+    from page import Page
+
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocabulary = [
+        "".join(rng.choices(letters, k=rng.randint(2, 10))) for _ in range(5000)
+    ]
+
+    def words(count):
+        return " ".join(rng.choices(vocabulary, k=count))
+
+    def markdown():
+        return "\n\n".join(
+            [
+                f"# {words(4)}",
+                f"{words(40)} **{words(2)}** {words(30)} [{words(2)}](/x.md)",
+                "\n".join(f"- {words(8)}" for _ in range(5)),
+                f"## {words(3)}",
+                f"{words(60)} _{words(3)}_ {words(30)}",
+                "> " + words(25),
+            ]
+        )
+
+    sources = [(f"page-{number}.md", markdown()) for number in range(page_count)]
+
+    def build(directory, index):
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        for page_id, source in sources:
+            page = Page(page_id)
+            html = markdown_to_html_node(source, page).to_html()
+            with open(os.path.join(directory, page_id + ".html"), "w") as file:
+                file.write(html)
+            if index is not None:
+                index.add_page(page)
+        if index is not None:
+            index.write(os.path.join(directory, "search"))
+        return time.perf_counter() - started, time.process_time() - cpu_started
+
+    # Builds with and without the index alternate, so drift in machine
+    # speed affects both the same way
+    plain_runs = []
+    indexed_runs = []
+    with tempfile.TemporaryDirectory() as directory:
+        for _ in range(repeats):
+            plain_runs.append(build(directory, None))
+            indexed_runs.append(build(directory, BackgroundSearchIndex()))
+    plain_seconds, plain_cpu = min(plain_runs)
+    indexed_seconds, indexed_cpu = min(indexed_runs)
+
+    print(f"{page_count} pages on {os.cpu_count()} CPUs")
+    print(f"build without index: {plain_seconds:.2f}s")
+    print(f"build with index: {indexed_seconds:.2f}s")
+    print(f"index overhead: {(indexed_seconds / plain_seconds - 1) * 100:.1f}%")
+    # Time the build process itself spends on CPU. With a free core for the
+    # indexing process, this is what the index adds to the build.
+    print(f"render path overhead: {(indexed_cpu / plain_cpu - 1) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    benchmark()
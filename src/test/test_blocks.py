@@ -1,5 +1,10 @@
 import unittest
-from blocks import BlockType, block_to_block_type
+from blocks import (
+    BlockType,
+    block_to_block_type,
+    heading_or_code_type,
+    bulk_line_block_type,
+)
 from helpers import markdown_to_blocks
 
 md = """
@@ -52,3 +57,29 @@ class TestBlockToBlockType(unittest.TestCase):
     def test_ordered_list(self):
         result = block_to_block_type(blocks[5])
         self.assertEqual(BlockType.ORDERED_LIST, result)
+
+
+class TestBulkLineBlockType(unittest.TestCase):
+
+    def test_large_unordered_list(self):
+        block = "\n".join(f"- item {i}" for i in range(1000))
+        self.assertEqual(BlockType.UNORDERED_LIST, block_to_block_type(block))
+
+    def test_large_quote(self):
+        block = "\n".join(f"> log line {i}" for i in range(1000))
+        self.assertEqual(BlockType.QUOTE, block_to_block_type(block))
+
+    def test_large_ordered_list(self):
+        block = "\n".join(f"{i}. entry" for i in range(1, 1001))
+        self.assertEqual(BlockType.ORDERED_LIST, block_to_block_type(block))
+
+    def test_large_paragraph(self):
+        lines = [f"{i}. entry" for i in range(1, 1001)]
+        lines[500] = "oops"
+        self.assertEqual(BlockType.PARAGRAPH, block_to_block_type("\n".join(lines)))
+
+    def test_matches_per_line_path(self):
+        for block in blocks + [">a\n>b\n", "1. a\n2. b\nc", "- a\n-b", "1. a", "\n"]:
+            if heading_or_code_type(block) is not None:
+                continue
+            self.assertEqual(block_to_block_type(block), bulk_line_block_type(block))
@@ -0,0 +1,81 @@
+import io
+import os
+import tempfile
+import unittest
+from feeds import write_page_lists, write_rss, write_sitemap
+from manifest import Manifest
+
+
+def make_manifest(count):
+    entries = {}
+    for number in range(count):
+        entries[f"post-{number}"] = {
+            "title": f"Post {number} & more",
+            "summary": f"Summary {number}",
+            "mtime": 86400.0 * number,
+            "path": f"posts/{number}.html",
+        }
+    return Manifest(entries)
+
+
+class TestSitemap(unittest.TestCase):
+    def test_sitemap(self):
+        file = io.StringIO()
+        write_sitemap(make_manifest(2), "https://example.com/", file)
+        self.assertIn(
+            "<url><loc>https://example.com/posts/1.html</loc>"
+            "<lastmod>1970-01-02</lastmod></url>",
+            file.getvalue(),
+        )
+        self.assertTrue(file.getvalue().endswith("</urlset>\n"))
+
+
+class TestRSS(unittest.TestCase):
+    def test_newest_items_first(self):
+        file = io.StringIO()
+        write_rss(make_manifest(5), "https://example.com", file, "Blog", limit=2)
+        feed = file.getvalue()
+        self.assertEqual(feed.count("<item>"), 2)
+        self.assertLess(feed.index("Post 4 &amp; more"), feed.index("Post 3"))
+        self.assertNotIn("Post 2", feed)
+
+
+class TestPageLists(unittest.TestCase):
+    def test_pagination(self):
+        with tempfile.TemporaryDirectory() as directory:
+            names = write_page_lists(make_manifest(5), directory, per_page=2)
+            self.assertEqual(names, ["index.html", "index-2.html", "index-3.html"])
+            with open(os.path.join(directory, "index-2.html")) as file:
+                html = file.read()
+
+        self.assertEqual(
+            html,
+            '<div><ul><li><a href="/posts/2.html">Post 2 &amp; more</a>'
+            "<p>Summary 2</p></li>"
+            '<li><a href="/posts/1.html">Post 1 &amp; more</a>'
+            "<p>Summary 1</p></li></ul>"
+            '<nav><a href="index.html">Newer</a><a href="index-3.html">Older</a></nav>'
+            "</div>",
+        )
+
+    def test_base_path_and_escaping(self):
+        manifest = Manifest(
+            {
+                "post": {
+                    "title": "<script>",
+                    "summary": "a < b",
+                    "mtime": 0.0,
+                    "path": "posts/post.html",
+                }
+            }
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            write_page_lists(manifest, directory, base_path="/docs/")
+            with open(os.path.join(directory, "index.html")) as file:
+                html = file.read()
+
+        self.assertEqual(
+            html,
+            '<div><ul><li><a href="/docs/posts/post.html">&lt;script&gt;</a>'
+            "<p>a &lt; b</p></li></ul></div>",
+        )
@@ -0,0 +1,43 @@
+import unittest
+from fuzz import (
+    DIFFERENTIAL_CHECKS,
+    find_mismatch,
+    random_inline,
+    reference_inline,
+    run_engine,
+    shrink,
+)
+from helpers import split_nodes_delimited
+from textnode import TextNode, TextType
+
+
+class TestDifferentialChecks(unittest.TestCase):
+    def test_alternative_engines_match_reference(self):
+        for name, reference, candidate, generate in DIFFERENTIAL_CHECKS:
+            with self.subTest(name):
+                self.assertIsNone(find_mismatch(reference, candidate, generate, 300))
+
+
+class TestHarness(unittest.TestCase):
+    def test_errors_are_outcomes(self):
+        def unbalanced(text):
+            nodes = [TextNode(text, TextType.TEXT)]
+            return split_nodes_delimited(nodes, "**", TextType.BOLD)
+
+        self.assertEqual(
+            run_engine(unbalanced, "a**b"),
+            ("error", "ValueError", "a**b does not contain a pair of **"),
+        )
+
+    def test_shrink(self):
+        self.assertEqual(shrink("abc\nxyz\n123", lambda value: "y" in value), "y")
+
+    def test_finds_and_shrinks_broken_engine(self):
+        def ignores_code(text):
+            return reference_inline(text.replace("`", ""))
+
+        mismatch = find_mismatch(reference_inline, ignores_code, random_inline)
+        self.assertIsNotNone(mismatch)
+        value, expected, actual = mismatch  # pyright: ignore
+        self.assertEqual(value, "`")
+        self.assertNotEqual(expected, actual)
@@ -224,3 +224,27 @@ class TestExtractMarkdownImages(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(alt_text, "picture of my dog")
         self.assertEqual(url, "https://imgur.nil/my_dog")
+
+
+class TestBulkBlocksToHTML(unittest.TestCase):
+    def test_large_list_matches_small_list_html(self):
+        items = [f"- item **{i}**" for i in range(600)]
+        html = markdown_to_html_node("\n".join(items)).to_html()
+        expected = "".join(f"<li>item <b>{i}</b></li>" for i in range(600))
+        self.assertEqual(html, f"<div><ul>{expected}</ul></div>")
+
+    def test_large_ordered_list(self):
+        items = [f"{i}. entry" for i in range(1, 601)]
+        html = markdown_to_html_node("\n".join(items)).to_html()
+        self.assertTrue(html.startswith("<div><ol><li>entry</li><li>entry</li>"))
+        self.assertEqual(html.count("<li>"), 600)
+
+    def test_large_quote(self):
+        lines = [f">>  quoted _line_ {i}  " for i in range(300)]
+        html = markdown_to_html_node("\n".join(lines)).to_html()
+        expected = " ".join(f"quoted <i>line</i> {i}" for i in range(300))
+        self.assertEqual(html, f"<div><blockquote>{expected}</blockquote></div>")
+
+    def test_quote_is_not_a_list(self):
+        html = markdown_to_html_node(">a\n>b").to_html()
+        self.assertEqual(html, "<div><blockquote>a b</blockquote></div>")
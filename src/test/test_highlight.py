@@ -0,0 +1,90 @@
+import importlib.util
+import unittest
+from unittest.mock import patch
+from helpers import markdown_to_html_node
+from highlight import (
+    HIGHLIGHTERS,
+    TOKEN_CACHE,
+    highlight_to_html_nodes,
+    pygments_highlighter,
+    regex_highlighter,
+    register_highlighter,
+)
+
+
+class TestHighlight(unittest.TestCase):
+    def test_python_tokens(self):
+        nodes = highlight_to_html_nodes('def f():\n    return "hi"  # done', "py")
+        html = "".join(node.to_html() for node in nodes)  # pyright: ignore
+        self.assertEqual(
+            html,
+            '<span class="k">def</span> f():\n    <span class="k">return</span> '
+            '<span class="s">"hi"</span>  <span class="c"># done</span>',
+        )
+
+    def test_unknown_language(self):
+        self.assertIsNone(highlight_to_html_nodes("x", "no-such-language"))
+
+    def test_cached_by_language_and_code(self):
+        calls = []
+
+        def counting_highlighter(code):
+            calls.append(code)
+            return [("k", code)]
+
+        register_highlighter("counted", counting_highlighter)
+        self.addCleanup(HIGHLIGHTERS.pop, "counted")
+        self.addCleanup(self.clear_cached_tokens, "counted")
+        first = highlight_to_html_nodes("same", "counted")
+        second = highlight_to_html_nodes("same", "counted")
+        self.assertEqual(calls, ["same"])
+        self.assertIsNot(first[0], second[0])  # pyright: ignore
+        self.assertIn("counted", [language for language, _ in TOKEN_CACHE])
+
+    def test_unknown_language_lookup_cached(self):
+        highlight_to_html_nodes("a", "no-such-language")
+        with patch("highlight.pygments_highlighter") as lookup:
+            highlight_to_html_nodes("b", "no-such-language")
+        lookup.assert_not_called()
+
+    @unittest.skipUnless(importlib.util.find_spec("pygments"), "needs Pygments")
+    def test_pygments_highlighter_keeps_all_text(self):
+        highlighter = pygments_highlighter("rust")
+        for code in ["fn main() {}", "\nfn main() {}\n\n", "\n\nlet x = 1;"]:
+            tokens = highlighter(code)  # pyright: ignore
+            self.assertEqual("".join(text for _, text in tokens), code)
+
+    def clear_cached_tokens(self, language):
+        for key in [key for key in TOKEN_CACHE if key[0] == language]:
+            del TOKEN_CACHE[key]
+
+    def test_regex_highlighter_keeps_all_text(self):
+        highlighter = regex_highlighter([("m", r"\d+")])
+        self.assertEqual(
+            highlighter("a1b22"), [(None, "a"), ("m", "1"), (None, "b"), ("m", "22")]
+        )
+
+
+class TestCodeBlockLanguage(unittest.TestCase):
+    def test_language_class_and_spans(self):
+        md = """
+        ```javascript
+        const x = 1;
+        ```
+        """
+        html = markdown_to_html_node(md).to_html()
+        self.assertEqual(
+            html,
+            '<div><pre><code class="language-javascript">'
+            '<span class="k">const</span> x = <span class="m">1</span>;\n'
+            "</code></pre></div>",
+        )
+
+    def test_unhighlighted_language_keeps_text(self):
+        md = "```no-such-language\nplain text\n```"
+        html = markdown_to_html_node(md).to_html()
+        self.assertEqual(
+            html,
+            '<div><pre><code class="language-no-such-language">plain text\n'
+            "</code></pre></div>",
+        )
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from helpers import markdown_to_html_node
+from manifest import Manifest
+from page import Page
+
+
+def converted_page(page_id, markdown):
+    page = Page(page_id)
+    markdown_to_html_node(markdown, page)
+    return page
+
+
+class TestManifest(unittest.TestCase):
+    def test_entry_from_page(self):
+        manifest = Manifest()
+        page = converted_page("post", "# My **Post**\n\nFirst _para_.\n\nSecond.")
+        manifest.update(page, 100.0, "post.html")
+        self.assertEqual(
+            manifest.entries["post"],
+            {
+                "title": "My Post",
+                "summary": "First para.",
+                "mtime": 100.0,
+                "path": "post.html",
+            },
+        )
+
+    def test_incremental_updates(self):
+        manifest = Manifest()
+        self.assertTrue(manifest.is_stale("post", 1.0))
+        manifest.update(converted_page("post", "Hello"), 1.0, "post.html")
+        self.assertTrue(manifest.changed)
+        self.assertFalse(manifest.is_stale("post", 1.0))
+        self.assertTrue(manifest.is_stale("post", 2.0))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "manifest.json")
+            manifest.save(path)
+            self.assertFalse(manifest.changed)
+            loaded = Manifest.load(path)
+
+        loaded.update(converted_page("post", "Hello"), 1.0, "post.html")
+        self.assertFalse(loaded.changed)
+        loaded.remove("post")
+        self.assertTrue(loaded.changed)
+        self.assertEqual(loaded.entries, {})
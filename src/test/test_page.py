@@ -0,0 +1,78 @@
+import unittest
+from helpers import markdown_to_html_node
+from page import Page, broken_anchor_links, slugify
+
+
+class TestSlugify(unittest.TestCase):
+    def test_slugify(self):
+        self.assertEqual(slugify("Hello, World!"), "hello-world")
+        self.assertEqual(
+            slugify("  Mixed - dashes  and_underscores "),
+            "mixed-dashes-and_underscores",
+        )
+
+
+class TestHeadingAnchors(unittest.TestCase):
+    def test_heading_ids_and_toc(self):
+        md = """
+        # Intro
+
+        ## Getting **started**
+
+        ## Intro
+
+        ### Intro
+        """
+        page = Page("index")
+        html = markdown_to_html_node(md, page).to_html()
+        self.assertEqual(
+            html,
+            '<div><h1 id="intro">Intro</h1>'
+            '<h2 id="getting-started">Getting <b>started</b></h2>'
+            '<h2 id="intro-1">Intro</h2>'
+            '<h3 id="intro-2">Intro</h3></div>',
+        )
+        self.assertEqual(
+            page.toc,
+            [
+                {"level": 1, "title": "Intro", "id": "intro"},
+                {"level": 2, "title": "Getting started", "id": "getting-started"},
+                {"level": 2, "title": "Intro", "id": "intro-1"},
+                {"level": 3, "title": "Intro", "id": "intro-2"},
+            ],
+        )
+
+    def test_no_page_no_ids(self):
+        html = markdown_to_html_node("# Intro").to_html()
+        self.assertEqual(html, "<div><h1>Intro</h1></div>")
+
+
+class TestBrokenAnchorLinks(unittest.TestCase):
+    def test_cross_page_anchors(self):
+        pages = {}
+        for page_id, md in [
+            ("index", "# Home\n\n[ok](#home) [bad](#nope) [other](guide#setup)"),
+            ("guide", "## Setup\n\n[back](index#missing) [ext](https://x.dev#a)"),
+        ]:
+            page = Page(page_id)
+            markdown_to_html_node(md, page)
+            pages[page_id] = page
+        self.assertEqual(
+            broken_anchor_links(pages),
+            [("index", "#nope"), ("guide", "index#missing")],
+        )
+
+    def test_links_relative_to_subdirectory(self):
+        pages = {}
+        for page_id, md in [
+            ("blog/a.md", "# A\n\n[bad](b.md#nope) [ok](b.md#b) [up](../index.md#top)"),
+            ("blog/b.md", "# B\n\n[home](/index.md#missing)"),
+            ("index.md", "# Top"),
+        ]:
+            page = Page(page_id)
+            markdown_to_html_node(md, page)
+            pages[page_id] = page
+        self.assertEqual(
+            broken_anchor_links(pages),
+            [("blog/a.md", "b.md#nope"), ("blog/b.md", "/index.md#missing")],
+        )
@@ -0,0 +1,42 @@
+import gc
+import unittest
+from unittest.mock import patch
+from render import RenderStats, peak_rss_kb, render_pages
+
+
+class TestRenderPages(unittest.TestCase):
+    def test_renders_and_collects_per_batch(self):
+        sources = [(f"page-{number}", f"# Page {number}") for number in range(5)]
+        written = []
+
+        stats = render_pages(
+            sources, lambda page, html: written.append((page.title, html)), 2
+        )
+
+        self.assertEqual(written[1], ("Page 1", '<div><h1 id="page-1">Page 1</h1></div>'))
+        self.assertEqual(stats.pages, 5)
+        # one collection after each full batch and one at the end
+        self.assertEqual(stats.gc_collections, 3)
+        self.assertTrue(gc.isenabled())
+
+    def test_gc_restored_after_error(self):
+        def fail(page, html):
+            raise RuntimeError("write failed")
+
+        callbacks = len(gc.callbacks)
+        with self.assertRaises(RuntimeError):
+            render_pages([("a", "text")], fail, stats=RenderStats())
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(len(gc.callbacks), callbacks)
+
+
+class TestPeakRSS(unittest.TestCase):
+    def test_units(self):
+        if peak_rss_kb() is None:
+            self.skipTest("resource module not available")
+        with patch("resource.getrusage") as getrusage:
+            getrusage.return_value.ru_maxrss = 2048 * 1024
+            with patch("sys.platform", "darwin"):
+                self.assertEqual(peak_rss_kb(), 2048)
+            with patch("sys.platform", "linux"):
+                self.assertEqual(peak_rss_kb(), 2048 * 1024)
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from helpers import markdown_to_html_node
+from page import Page
+from routes import RouteTable
+
+
+class TestRouteTable(unittest.TestCase):
+    def setUp(self):
+        self.routes = RouteTable(
+            {
+                "index.md": "index.html",
+                "blog/post.md": "blog/post.html",
+                "images/cat.png": "images/cat.1a2b3c4d.png",
+            },
+            base_path="/site/",
+        )
+
+    def test_relative_and_absolute_links(self):
+        cases = [
+            ("post.md", "blog/index.md", "/site/blog/post.html"),
+            ("../index.md#top", "blog/post.md", "/site/index.html#top"),
+            ("/images/cat.png", "blog/post.md", "/site/images/cat.1a2b3c4d.png"),
+            ("blog/post.md?x=1", "index.md", "/site/blog/post.html?x=1"),
+        ]
+        for url, source, expected in cases:
+            self.assertEqual(self.routes.resolve(url, source), expected)
+
+    def test_external_links_unchanged(self):
+        urls = ["https://boot.dev", "mailto:a@b.c", "#intro", "//cdn.example.com/x.js"]
+        for url in urls:
+            self.assertEqual(self.routes.resolve(url, "index.md"), url)
+
+    def test_unresolved(self):
+        self.assertIsNone(self.routes.resolve("missing.md", "index.md"))
+
+    def test_from_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, "blog"))
+            for name in ["index.md", "blog/post.md", "logo.svg"]:
+                with open(os.path.join(directory, name), "w") as file:
+                    file.write("content")
+            routes = RouteTable.from_directory(directory, fingerprint_assets=True)
+
+        self.assertEqual(routes.routes["index.md"], "/index.html")
+        self.assertEqual(routes.routes["blog/post.md"], "/blog/post.html")
+        self.assertRegex(routes.routes["logo.svg"], r"^/logo\.[0-9a-f]{8}\.svg$")
+
+
+class TestPageLinkRewriting(unittest.TestCase):
+    def test_links_and_images_rewritten(self):
+        routes = RouteTable({"blog/post.md": "blog/post.html", "cat.png": "cat.png"})
+        page = Page("index.md", routes)
+        md = "See [post](blog/post.md), ![cat](cat.png) and [gone](gone.md)"
+        html = markdown_to_html_node(md, page).to_html()
+        self.assertEqual(
+            html,
+            '<div><p>See <a href="/blog/post.html">post</a>, '
+            '<img src="/cat.png" alt="cat"></img> and '
+            '<a href="gone.md">gone</a></p></div>',
+        )
+        self.assertEqual(page.unresolved, ["gone.md"])
+
+    def test_without_routes_links_unchanged(self):
+        html = markdown_to_html_node("[post](blog/post.md)", Page("index.md")).to_html()
+        self.assertEqual(html, '<div><p><a href="blog/post.md">post</a></p></div>')
@@ -0,0 +1,132 @@
+import json
+import os
+import tempfile
+import unittest
+from helpers import markdown_to_html_node
+from page import Page
+from search import (
+    POSITION_BITS,
+    BackgroundSearchIndex,
+    SearchIndex,
+    decode_postings,
+    read_shard,
+    shard_name,
+    tokenize,
+)
+
+
+def index_pages(pages):
+    index = SearchIndex()
+    for page_id, markdown in pages:
+        page = Page(page_id)
+        markdown_to_html_node(markdown, page)
+        index.add_page(page)
+    return index
+
+
+class TestTokenize(unittest.TestCase):
+    def test_lowercase_words(self):
+        self.assertEqual(tokenize("Hello, World! it's"), ["hello", "world", "it", "s"])
+
+    def test_non_ascii_punctuation(self):
+        self.assertEqual(
+            tokenize("¿Qué pasa? café·bar 、x"), ["qué", "pasa", "café", "bar", "x"]
+        )
+
+
+class TestSearchIndex(unittest.TestCase):
+    def test_only_plain_text_is_indexed(self):
+        index = index_pages(
+            [("home", "# Welcome home\n\nSome **bold** and [a link](/x) text")]
+        )
+        self.assertEqual(index.search("welcome"), ["home"])
+        self.assertEqual(index.search("text"), ["home"])
+        self.assertEqual(index.search("bold"), [])
+        self.assertEqual(index.search("link"), [])
+
+    def test_positions_across_pages(self):
+        index = index_pages([("a", "one two one"), ("b", "- two\n- one")])
+        self.assertEqual(index.search("one"), ["a", "b"])
+        self.assertEqual(
+            decode_postings(index.deltas["one"]),
+            [(0, 0), (0, 2), (1, 1)],
+        )
+
+    def test_postings_are_delta_encoded(self):
+        index = index_pages([("a", "x y x"), ("b", "z"), ("c", "y x")])
+        page = 1 << POSITION_BITS
+        self.assertEqual(list(index.deltas["x"]), [0, 2, 2 * page - 1])
+
+    def test_write_sharded_index(self):
+        index = index_pages([("a", "apple avocado"), ("b", "banana")])
+        with tempfile.TemporaryDirectory() as directory:
+            index.write(directory)
+            self.assertEqual(sorted(os.listdir(directory)), ["pages.json", "shards"])
+            self.assertEqual(
+                sorted(os.listdir(os.path.join(directory, "shards"))),
+                ["61.bin", "62.bin"],
+            )
+            with open(os.path.join(directory, "pages.json")) as file:
+                self.assertEqual(json.load(file), ["a", "b"])
+            shard = read_shard(os.path.join(directory, "shards", "61.bin"))
+
+        self.assertEqual(
+            {term: decode_postings(deltas) for term, deltas in shard.items()},
+            {"apple": [(0, 0)], "avocado": [(0, 1)]},
+        )
+
+    def test_long_prefix_keeps_page_list(self):
+        index = index_pages([("a", "pages pagestack")])
+        with tempfile.TemporaryDirectory() as directory:
+            index.write(directory, prefix_length=5)
+            with open(os.path.join(directory, "pages.json")) as file:
+                self.assertEqual(json.load(file), ["a"])
+            shard = read_shard(os.path.join(directory, "shards", shard_name("pages")))
+        self.assertEqual(sorted(shard), ["pages", "pagestack"])
+
+    def test_shard_names_are_hex_encoded(self):
+        self.assertEqual(shard_name("a"), "61.bin")
+        self.assertEqual(shard_name("é"), "c3a9.bin")
+        self.assertNotEqual(shard_name("A"), shard_name("a"))
+
+        index = index_pages([("a", "élan\0null")])
+        with tempfile.TemporaryDirectory() as directory:
+            index.write(directory)
+            self.assertEqual(
+                sorted(os.listdir(os.path.join(directory, "shards"))),
+                ["6e.bin", "c3a9.bin"],
+            )
+
+
+class TestBackgroundSearchIndex(unittest.TestCase):
+    def write_index(self, index, directory, pages):
+        for page_id, markdown in pages:
+            page = Page(page_id)
+            markdown_to_html_node(markdown, page)
+            index.add_page(page)
+        index.write(directory)
+        files = {}
+        for root, _, names in os.walk(directory):
+            for name in names:
+                path = os.path.join(root, name)
+                with open(path, "rb") as file:
+                    files[os.path.relpath(path, directory)] = file.read()
+        return files
+
+    def test_writes_same_index_as_in_process(self):
+        pages = [
+            (f"page-{number}", f"word{number % 7} common")
+            for number in range(250)
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            expected = self.write_index(SearchIndex(), directory, pages)
+        with tempfile.TemporaryDirectory() as directory:
+            index = BackgroundSearchIndex(batch_size=100)
+            actual = self.write_index(index, directory, pages)
+        self.assertEqual(actual, expected)
+
+    def test_write_error_is_raised(self):
+        index = BackgroundSearchIndex()
+        with tempfile.NamedTemporaryFile() as file:
+            with self.assertRaises(OSError):
+                index.write(file.name)